@@ -4,6 +4,7 @@
 
 # Configuration
 REMINDER_CACHE="$HOME/.cache/prompt-reminder/current_reminder.txt"
+REMINDER_SHOWN="$HOME/.cache/prompt-reminder/shown_reminder.txt"
 CONDA_ENV_PYTHON="/opt/miniconda3/envs/prompt-reminder/bin/python"
 REMINDER_SCRIPT="$(dirname "${BASH_SOURCE[0]}")/prompt_reminder.py"
 
@@ -14,7 +15,8 @@ RESET_COLOR='\033[0m'
 # Function to read current reminder
 get_current_reminder() {
     if [[ -f "$REMINDER_CACHE" ]]; then
-        cat "$REMINDER_CACHE" 2>/dev/null
+        # Tell the daemon which reminder was actually displayed
+        tee "$REMINDER_SHOWN" < "$REMINDER_CACHE" 2>/dev/null
     else
         echo ""
     fi
@@ -29,10 +31,12 @@ display_reminder() {
 }
 
 # Add to PROMPT_COMMAND to run before each prompt
+# 'history -a' writes each command to the history file as it runs, not on
+# shell exit, so the daemon can see which tips get used
 if [[ -z "$PROMPT_COMMAND" ]]; then
-    PROMPT_COMMAND="display_reminder"
+    PROMPT_COMMAND="history -a; display_reminder"
 else
-    PROMPT_COMMAND="display_reminder; $PROMPT_COMMAND"
+    PROMPT_COMMAND="history -a; display_reminder; $PROMPT_COMMAND"
 fi
 
 # Start the daemon
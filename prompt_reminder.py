@@ -5,6 +5,9 @@ Continuously updates reminder cache file every 10 seconds
 """
 
 import random
+import re
+import struct
+import zlib
 import psutil
 import os
 import time
@@ -13,6 +16,9 @@ import sys
 import subprocess
 import json
 import base64
+import select
+import shutil
+from collections import deque
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -288,6 +294,17 @@ GIT_COMMANDS = [
     "🌿 Git: 'git bisect start' - Binary search for bug introduction",
 ]
 
+# Curated tips by weighting category
+CATEGORY_TIPS = {
+    'git': GIT_COMMANDS,
+    'linux': LINUX_TIPS,
+    'shortcuts': TERMINAL_SHORTCUTS,
+    'tricks': TERMINAL_TRICKS,
+    'copilot': GITHUB_COPILOT_TIPS,
+    'useful': USEFUL_COMMANDS,
+}
+TIP_CATEGORIES = {tip: category for category, tips in CATEGORY_TIPS.items() for tip in tips}
+
 # GitHub Copilot integration
 COPILOT_CACHE_FILE = Path.home() / '.cache' / 'prompt-reminder' / 'copilot_suggestions.json'
 COPILOT_CACHE_DURATION = 600  # Cache for 10 minutes
@@ -437,19 +454,27 @@ def get_disk_info():
     except:
         return None
 
-def detect_context():
-    """Detect current working context for smart suggestions"""
+def get_history_file():
+    """Get the history file for the user's shell, or None if unknown"""
+    shell = os.environ.get('SHELL', '')
+    
+    if 'zsh' in shell:
+        return os.path.expanduser('~/.zsh_history')
+    elif 'bash' in shell:
+        return os.path.expanduser('~/.bash_history')
+    return None
+
+def detect_directory_context(cwd=None):
+    """Detect project type from the files in a directory"""
     context = {
         'is_git_repo': False,
         'is_python_project': False,
         'is_node_project': False,
         'is_docker_project': False,
-        'recent_commands': [],
-        'last_command_type': None
     }
     
     # Check current directory context
-    cwd = os.getcwd()
+    cwd = cwd or os.getcwd()
     
     # Git repository?
     if os.path.isdir(os.path.join(cwd, '.git')):
@@ -469,15 +494,18 @@ def detect_context():
     if any(os.path.isfile(os.path.join(cwd, f)) for f in docker_indicators):
         context['is_docker_project'] = True
     
+    return context
+
+def detect_history_context():
+    """Detect recent activity from the shell history"""
+    context = {
+        'recent_commands': [],
+        'last_command_type': None
+    }
+    
     # Parse recent command history
     try:
-        shell = os.environ.get('SHELL', '')
-        history_file = None
-        
-        if 'zsh' in shell:
-            history_file = os.path.expanduser('~/.zsh_history')
-        elif 'bash' in shell:
-            history_file = os.path.expanduser('~/.bash_history')
+        history_file = get_history_file()
         
         if history_file and os.path.isfile(history_file):
             with open(history_file, 'rb') as f:
@@ -510,10 +538,15 @@ def detect_context():
     
     return context
 
-def get_weighted_reminder(context):
+def detect_context(cwd=None):
+    """Detect current working context for smart suggestions"""
+    return {**detect_directory_context(cwd), **detect_history_context()}
+
+def get_weighted_reminder(context, ai_suggestions=None):
     """Get reminder with intelligent weighting based on context"""
     # Fetch AI suggestions from GitHub Copilot (cached, non-blocking)
-    ai_suggestions = fetch_copilot_suggestions(context)
+    if ai_suggestions is None:
+        ai_suggestions = fetch_copilot_suggestions(context)
     
     # Start with equal weights
     weights = {
@@ -536,26 +569,31 @@ def get_weighted_reminder(context):
     if context['last_command_type'] == 'docker':
         weights['linux'] *= 1.5  # Docker users need linux commands
     
-    # Build weighted list
-    weighted_reminders = []
-    weighted_reminders.extend(GIT_COMMANDS * int(weights['git']))
-    weighted_reminders.extend(LINUX_TIPS * int(weights['linux']))
-    weighted_reminders.extend(TERMINAL_SHORTCUTS * int(weights['shortcuts']))
-    weighted_reminders.extend(TERMINAL_TRICKS * int(weights['tricks']))
-    weighted_reminders.extend(GITHUB_COPILOT_TIPS * int(weights['copilot']))
-    weighted_reminders.extend(USEFUL_COMMANDS * int(weights['useful']))
-    weighted_reminders.extend(ai_suggestions * int(weights['ai']))
+    # Build weighted list, scaled by how often shown tips were adopted
+    pooled_rate = get_pooled_adoption_rate()
+    reminders = []
+    reminder_weights = []
+    for category, tips in {**CATEGORY_TIPS, 'ai': ai_suggestions}.items():
+        category_weight = weights[category] * get_adoption_factor(
+            ADOPTION_STATS['categories'].get(category), pooled_rate
+        )
+        for tip in tips:
+            reminders.append(tip)
+            reminder_weights.append(category_weight * get_adoption_factor(
+                ADOPTION_STATS['tips'].get(str(get_tip_id(tip))), pooled_rate
+            ))
     
-    return random.choice(weighted_reminders)
+    return random.choices(reminders, weights=reminder_weights)[0]
 
-def get_random_reminder():
+def get_random_reminder(context=None, ai_suggestions=None):
     """Get a random reminder from all categories with context awareness"""
     try:
         # Detect context for smart suggestions
-        context = detect_context()
+        if context is None:
+            context = detect_context()
         
         # Get weighted reminder based on context
-        return get_weighted_reminder(context)
+        return get_weighted_reminder(context, ai_suggestions)
     except Exception as e:
         # Fallback to simple random if context detection fails
         all_reminders = (
@@ -571,21 +609,517 @@ def get_random_reminder():
 # Cache file location
 CACHE_DIR = Path.home() / '.cache' / 'prompt-reminder'
 CACHE_FILE = CACHE_DIR / 'current_reminder.txt'
+SHOWN_FILE = CACHE_DIR / 'shown_reminder.txt'  # Written by prompts that display the cache file
 PID_FILE = CACHE_DIR / 'daemon.pid'
 
 def setup_cache():
     """Create cache directory if it doesn't exist"""
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+# Adoption tracking: every reminder shown is appended to a binary journal,
+# and commands that later show up in the history tail are matched against
+# recent tips to learn which ones actually change behaviour
+JOURNAL_FILE = CACHE_DIR / 'reminder_journal.bin'
+JOURNAL_MAX_BYTES = 1024 * 1024  # Rotate to reminder_journal.bin.1 at 1MB
+JOURNAL_RECORD = struct.Struct('<BIIB')  # kind, unix time, tip id, context signature
+JOURNAL_SHOWN = 0
+JOURNAL_ADOPTED = 1
+STATS_FILE = CACHE_DIR / 'adoption_stats.json'
+STATS_SAVE_INTERVAL = 300  # Save aggregates every 5 minutes
+ADOPTION_WINDOW = 600  # Count an adoption within 10 minutes of a tip being shown
+ADOPTION_PRIOR = 2  # Smoothing: act as if each tip had 2 more adoptions at the pooled rate
+LAST_COMMAND_TYPES = [None, 'git', 'docker', 'python', 'node']
+LITERAL_TOKEN = re.compile(r'^(--?[A-Za-z][A-Za-z0-9-]*|[a-z][a-z0-9-]*)$')
+# Plain words the tips use as stand-ins for the user's own argument
+PLACEHOLDER_WORDS = {'branch', 'new-branch', 'file', 'url', 'command'}
+# The command a curated tip leads with: "🌿 Git: 'cmd' - ..." or "💡 Tip: Use 'cmd' to ..."
+TIP_COMMAND = re.compile(r"^[^:']+: (?:Use )?'(.+?)'(?: - | to | for )")
+
+JOURNAL = None
+ADOPTION_STATS = {'tips': {}, 'categories': {}}
+STATS_LAST_SAVE = 0
+PENDING_SHOWS = deque()  # (shown time, tip id, category, context signature, command key)
+HISTORY_OFFSET = None
+HISTORY_INODE = None
+HISTORY_MTIME = None
+CACHE_REMINDERS = {}  # Recent cache-file reminders not yet displayed -> context
+SHOWN_MTIME = None
+
+def get_tip_id(tip):
+    """Get a stable 32-bit id for a tip"""
+    return zlib.crc32(tip.encode('utf-8'))
+
+def get_context_signature(context):
+    """Pack the detected context into one byte for the journal"""
+    signature = (
+        context['is_git_repo'] |
+        context['is_python_project'] << 1 |
+        context['is_node_project'] << 2 |
+        context['is_docker_project'] << 3
+    )
+    if context['last_command_type'] in LAST_COMMAND_TYPES:
+        signature |= LAST_COMMAND_TYPES.index(context['last_command_type']) << 4
+    return signature
+
+def get_adoption_key(tip):
+    """Get the literal command prefix a tip suggests, e.g. ('git', 'stash', 'pop')"""
+    category = TIP_CATEGORIES.get(tip, 'ai')
+    if category == 'shortcuts':
+        # Key presses never show up in the history
+        return None
+    elif category == 'ai':
+        command = tip.split(': ', 1)[-1]
+    else:
+        match = TIP_COMMAND.match(tip)
+        if not match:
+            return None
+        command = match.group(1)
+    
+    # Stop at placeholders like 'branch_name', 'file.log', 'HEAD~1' or 'url'
+    tokens = command.split()
+    key = []
+    for i, token in enumerate(tokens):
+        # 'git branch' names a subcommand, 'git checkout branch' a placeholder
+        is_git_subcommand = i == 1 and tokens[0] == 'git'
+        if not LITERAL_TOKEN.match(token) or (token in PLACEHOLDER_WORDS and not is_git_subcommand):
+            break
+        key.append(token)
+    
+    # A bare 'cd' or 'find' would match almost anything, so a single word
+    # only counts when it is the whole suggested command
+    if len(key) >= 2 or (key and len(tokens) == 1):
+        return tuple(key)
+    return None
+
+def get_longest_adoption_key(tokens, keys):
+    """Get the longest key in keys that the command tokens start with"""
+    for length in range(len(tokens), 0, -1):
+        if tuple(tokens[:length]) in keys:
+            return tuple(tokens[:length])
+    return None
+
+CURATED_ADOPTION_KEYS = {get_adoption_key(tip) for tip in TIP_CATEGORIES} - {None}
+
+def get_pooled_adoption_rate():
+    """Get the adoption rate across all tracked tips"""
+    shown = sum(counts[0] for counts in ADOPTION_STATS['categories'].values())
+    adopted = sum(counts[1] for counts in ADOPTION_STATS['categories'].values())
+    return adopted / shown if shown else 0.0
+
+def get_adoption_factor(counts, pooled_rate):
+    """Scale a weight by its smoothed adoption rate relative to the pooled rate"""
+    # Untracked tips, and everything before the first adoption, stay neutral
+    if not counts or not pooled_rate:
+        return 1.0
+    
+    shown, adopted = counts
+    rate = (adopted + ADOPTION_PRIOR) / (shown + ADOPTION_PRIOR / pooled_rate)
+    return min(max(rate / pooled_rate, 0.5), 3.0)
+
+def append_journal(kind, tip_id, context_signature):
+    """Append one fixed-size record to the journal, rotating it when full"""
+    global JOURNAL
+    
+    if JOURNAL is None:
+        JOURNAL = open(JOURNAL_FILE, 'ab')
+    JOURNAL.write(JOURNAL_RECORD.pack(kind, int(time.time()), tip_id, context_signature))
+    JOURNAL.flush()
+    
+    if JOURNAL.tell() >= JOURNAL_MAX_BYTES:
+        JOURNAL.close()
+        JOURNAL = None
+        os.replace(JOURNAL_FILE, JOURNAL_FILE.with_suffix('.bin.1'))
+
+def count_adoption_stat(tip_id, category, index):
+    """Increment the shown (0) or adopted (1) count for a tip and its category"""
+    for counts in (
+        ADOPTION_STATS['tips'].setdefault(str(tip_id), [0, 0]),
+        ADOPTION_STATS['categories'].setdefault(category, [0, 0]),
+    ):
+        counts[index] += 1
+
+def record_shown(tip, context):
+    """Journal a shown tip and start watching the history for its command"""
+    tip_id = get_tip_id(tip)
+    context_signature = get_context_signature(context)
+    try:
+        append_journal(JOURNAL_SHOWN, tip_id, context_signature)
+    except Exception:
+        # Adoption tracking is best effort, never worth stopping the daemon
+        return
+    
+    # Only tips that suggest a concrete command can be adopted
+    key = get_adoption_key(tip)
+    if key:
+        category = TIP_CATEGORIES.get(tip, 'ai')
+        count_adoption_stat(tip_id, category, 0)
+        PENDING_SHOWS.append((time.time(), tip_id, category, context_signature, key))
+
+def remember_cache_reminder(reminder, context):
+    """Remember a cache-file reminder until a prompt reports displaying it"""
+    CACHE_REMINDERS.pop(reminder, None)
+    CACHE_REMINDERS[reminder] = context
+    # A prompt may still be showing the previous tick's reminder
+    while len(CACHE_REMINDERS) > 2:
+        del CACHE_REMINDERS[next(iter(CACHE_REMINDERS))]
+
+def process_shown_marker():
+    """Record the cache-file reminder a prompt displayed since the last tick"""
+    global SHOWN_MTIME
+    
+    try:
+        mtime = os.stat(SHOWN_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return
+    if mtime == SHOWN_MTIME:
+        return
+    SHOWN_MTIME = mtime
+    
+    # Each pick counts once, however many prompts displayed it
+    reminder = SHOWN_FILE.read_text(encoding='utf-8', errors='ignore').strip()
+    context = CACHE_REMINDERS.pop(reminder, None)
+    if context is not None:
+        record_shown(reminder, context)
+
+def parse_history_line(line):
+    """Parse a history line into (timestamp or None, command)"""
+    cmd = line.decode('utf-8', errors='ignore').strip()
+    
+    # zsh extended history: ': 1700000000:0;git status'
+    if cmd.startswith(':') and ';' in cmd:
+        meta, cmd = cmd.split(';', 1)
+        try:
+            return int(meta.split(':')[1]), cmd.strip()
+        except (IndexError, ValueError):
+            return None, cmd.strip()
+    return None, cmd
+
+def process_history_tail():
+    """Match commands appended to the history since the last tick against pending tips"""
+    global HISTORY_OFFSET, HISTORY_INODE, HISTORY_MTIME, PENDING_SHOWS
+    
+    now = time.time()
+    while PENDING_SHOWS and PENDING_SHOWS[0][0] < now - ADOPTION_WINDOW:
+        PENDING_SHOWS.popleft()
+    
+    history_file = get_history_file()
+    if not history_file or not os.path.isfile(history_file):
+        return
+    
+    stat = os.stat(history_file)
+    size = stat.st_size
+    # zsh replaces the file when trimming to SAVEHIST (new inode), bash trims
+    # to HISTFILESIZE in place, so the size alone can't tell a rewrite apart
+    rewritten = (
+        HISTORY_OFFSET is None or
+        stat.st_ino != HISTORY_INODE or
+        size < HISTORY_OFFSET or
+        (size == HISTORY_OFFSET and stat.st_mtime_ns != HISTORY_MTIME)
+    )
+    HISTORY_INODE = stat.st_ino
+    HISTORY_MTIME = stat.st_mtime_ns
+    
+    if not rewritten and size > HISTORY_OFFSET:
+        with open(history_file, 'rb') as f:
+            # Include the byte before the offset: it ends the last line we
+            # read, so anything else means the file was rewritten in place
+            f.seek(max(HISTORY_OFFSET - 1, 0))
+            data = f.read(size - HISTORY_OFFSET + min(HISTORY_OFFSET, 1))
+        if HISTORY_OFFSET:
+            rewritten = not data.startswith(b'\n')
+            data = data[1:]
+    
+    if rewritten:
+        # First tick or history rewritten: only commands from now on count
+        HISTORY_OFFSET = size
+        return
+    if size == HISTORY_OFFSET:
+        return
+    
+    # Leave a partially written last line for the next tick
+    complete = data.rfind(b'\n') + 1
+    HISTORY_OFFSET += complete
+    
+    for line in data[:complete].splitlines():
+        timestamp, cmd = parse_history_line(line)
+        tokens = cmd.split()
+        if not tokens or not PENDING_SHOWS:
+            continue
+        
+        # Only the most specific tip gets credit: 'git stash pop' adopts the
+        # 'git stash pop' tip, not the 'git stash' tip as well
+        longest_key = get_longest_adoption_key(
+            tokens, CURATED_ADOPTION_KEYS | {show[4] for show in PENDING_SHOWS}
+        )
+        if longest_key is None:
+            continue
+        
+        # Each tip is adopted at most once per command, however often it was shown
+        adopted = set()
+        for shown_time, tip_id, category, context_signature, key in PENDING_SHOWS:
+            if tip_id in adopted or (timestamp and timestamp < int(shown_time)):
+                continue
+            if key == longest_key:
+                adopted.add(tip_id)
+                append_journal(JOURNAL_ADOPTED, tip_id, context_signature)
+                count_adoption_stat(tip_id, category, 1)
+        
+        if adopted:
+            PENDING_SHOWS = deque(show for show in PENDING_SHOWS if show[1] not in adopted)
+
+def is_valid_adoption_counts(counts):
+    """Check that a stats entry is a [shown, adopted] pair of counts"""
+    return (
+        isinstance(counts, list) and len(counts) == 2 and
+        all(type(n) is int and n >= 0 for n in counts) and
+        counts[1] <= counts[0]
+    )
+
+def load_adoption_stats():
+    """Load aggregated adoption stats saved by a previous daemon run"""
+    global ADOPTION_STATS
+    
+    if STATS_FILE.exists():
+        try:
+            with open(STATS_FILE, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        # Drop malformed entries rather than letting them break weighting
+        for section in ('tips', 'categories'):
+            entries = data.get(section) if isinstance(data, dict) else None
+            if not isinstance(entries, dict):
+                continue
+            ADOPTION_STATS[section] = {
+                key: counts for key, counts in entries.items()
+                if is_valid_adoption_counts(counts)
+            }
+
+def save_adoption_stats():
+    """Save aggregated adoption stats so weights survive daemon restarts"""
+    global STATS_LAST_SAVE
+    
+    # Counted as attempted even on failure, so a full disk isn't retried every tick
+    STATS_LAST_SAVE = time.time()
+    try:
+        tmp_file = STATS_FILE.with_suffix('.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(ADOPTION_STATS, f)
+        os.replace(tmp_file, STATS_FILE)
+    except Exception:
+        pass
+
+# tmux integration: the daemon keeps a single control-mode client (tmux -C)
+# open and pushes reminders into a per-pane user option, instead of every
+# shell forking `tmux set-option -g` on each prompt
+TMUX_STATUS_FORMAT = "#[fg=colour240]#{=/80/...:@reminder}#[default]"
+TMUX_COMMAND_TIMEOUT = 2  # Seconds to wait for a control-mode reply
+TMUX_RETRY_INTERVAL = 300  # Wait 5 minutes before retrying a failed attach
+TMUX_CONTROL = None
+TMUX_BUFFER = b''
+TMUX_PANE_REMINDERS = {}
+TMUX_FAILED_SOCKET = None
+TMUX_FAILED_AT = 0
+
+def get_tmux_socket():
+    """Get the tmux server socket path, or None if no server is running"""
+    tmux_env = os.environ.get('TMUX')
+    if tmux_env:
+        socket_path = tmux_env.split(',')[0]
+    else:
+        tmux_tmpdir = os.environ.get('TMUX_TMPDIR', '/tmp')
+        socket_path = os.path.join(tmux_tmpdir, f'tmux-{os.getuid()}', 'default')
+    
+    if os.path.exists(socket_path):
+        return socket_path
+    return None
+
+def quote_tmux(value):
+    """Quote a string as a single tmux command argument"""
+    value = value.replace('\n', ' ')
+    for char in ('\\', '"', '$'):
+        value = value.replace(char, '\\' + char)
+    return f'"{value}"'
+
+def read_tmux_reply():
+    """Read one %begin/%end reply from the control client, skipping notifications"""
+    global TMUX_BUFFER
+    
+    fd = TMUX_CONTROL.stdout.fileno()
+    deadline = time.monotonic() + TMUX_COMMAND_TIMEOUT
+    output = None
+    
+    while True:
+        while b'\n' not in TMUX_BUFFER:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise TimeoutError("tmux control client did not reply")
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                raise EOFError("tmux control client exited")
+            TMUX_BUFFER += chunk
+        
+        raw_line, TMUX_BUFFER = TMUX_BUFFER.split(b'\n', 1)
+        line = raw_line.decode('utf-8', errors='replace')
+        
+        if line.startswith('%begin'):
+            output = []
+        elif output is None:
+            # Asynchronous notification (%sessions-changed etc.), not a reply
+            continue
+        elif line.startswith('%end'):
+            return True, output
+        elif line.startswith('%error'):
+            return False, output
+        else:
+            output.append(line)
+
+def run_tmux_commands(commands):
+    """Send a batch of commands in one write and collect a reply for each"""
+    TMUX_CONTROL.stdin.write(''.join(f'{cmd}\n' for cmd in commands).encode('utf-8'))
+    TMUX_CONTROL.stdin.flush()
+    return [read_tmux_reply() for _ in commands]
+
+def close_tmux_control():
+    """Close the tmux control-mode client if it is open"""
+    global TMUX_CONTROL, TMUX_BUFFER, TMUX_PANE_REMINDERS
+    
+    if TMUX_CONTROL:
+        try:
+            TMUX_CONTROL.stdin.close()
+            TMUX_CONTROL.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            TMUX_CONTROL.kill()
+    
+    TMUX_CONTROL = None
+    TMUX_BUFFER = b''
+    # Panes must be refreshed in full on the next connection
+    TMUX_PANE_REMINDERS = {}
+
+def connect_tmux_control():
+    """Open the tmux control-mode client if needed, return True when connected"""
+    global TMUX_CONTROL, TMUX_FAILED_SOCKET, TMUX_FAILED_AT
+    
+    if TMUX_CONTROL and TMUX_CONTROL.poll() is None:
+        return True
+    close_tmux_control()
+    
+    socket_path = get_tmux_socket()
+    if not socket_path or not shutil.which('tmux'):
+        return False
+    
+    # Don't fork a new client every tick for a stale socket or an old tmux
+    if socket_path == TMUX_FAILED_SOCKET and time.time() - TMUX_FAILED_AT < TMUX_RETRY_INTERVAL:
+        return False
+    
+    try:
+        # no-output: don't stream pane contents, ignore-size: don't resize windows
+        TMUX_CONTROL = subprocess.Popen(
+            ['tmux', '-S', socket_path, '-C', 'attach-session', '-f', 'no-output,ignore-size'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        # tmux replies to the attach-session command itself first
+        attached, _ = read_tmux_reply()
+        if attached:
+            [(attached, _)] = run_tmux_commands([
+                f"set-option -g status-right {quote_tmux(TMUX_STATUS_FORMAT)}"
+            ])
+    except (OSError, TimeoutError, EOFError):
+        attached = False
+    
+    if attached:
+        TMUX_FAILED_SOCKET = None
+    else:
+        close_tmux_control()
+        TMUX_FAILED_SOCKET = socket_path
+        TMUX_FAILED_AT = time.time()
+    return attached
+
+def update_tmux_status(context, ai_suggestions, reminder):
+    """Push a reminder to each tmux pane, only sending panes whose reminder changed"""
+    global TMUX_PANE_REMINDERS
+    
+    if not connect_tmux_control():
+        return
+    
+    try:
+        [(clients_ok, clients), (ok, panes)] = run_tmux_commands([
+            'list-clients -F "#{client_control_mode} #{session_id}"',
+            'list-panes -a -F "#{pane_id} #{session_id} #{pane_active}#{window_active} #{pane_current_path}"',
+        ])
+        if not ok:
+            return
+        
+        # Sessions someone is looking at, not counting our own control client
+        viewed_sessions = {
+            line.split(' ')[1] for line in clients if clients_ok and line.startswith('0 ')
+        }
+        
+        # History and Copilot suggestions are shared, so per pane only the
+        # directory is checked, and panes with the same context share a tip
+        signature_reminders = {get_context_signature(context): reminder}
+        pane_reminders = {}
+        changed = []
+        for line in panes:
+            pane_id, session_id, active, path = line.split(' ', 3)
+            visible = active == '11' and session_id in viewed_sessions
+            pane_context = {**context, **detect_directory_context(path or None)}
+            signature = get_context_signature(pane_context)
+            if signature not in signature_reminders:
+                signature_reminders[signature] = get_random_reminder(pane_context, ai_suggestions)
+            reminder = signature_reminders[signature]
+            
+            if TMUX_PANE_REMINDERS.get(pane_id) == reminder:
+                pane_reminders[pane_id] = reminder
+            else:
+                changed.append((pane_id, reminder, pane_context, visible))
+        
+        if changed:
+            replies = run_tmux_commands([
+                f"set-option -p -t {pane_id} @reminder {quote_tmux(reminder)}"
+                for pane_id, reminder, _, _ in changed
+            ])
+            # Panes whose update failed (e.g. closed meanwhile) are retried next tick
+            for (pane_id, reminder, pane_context, visible), (applied, _) in zip(changed, replies):
+                if applied:
+                    pane_reminders[pane_id] = reminder
+                    # Only a new tip in a pane someone is looking at counts as shown
+                    if visible:
+                        record_shown(reminder, pane_context)
+        TMUX_PANE_REMINDERS = pane_reminders
+    except (OSError, TimeoutError, EOFError):
+        close_tmux_control()
+
 def update_reminder():
-    """Update the reminder cache file"""
-    reminder = get_random_reminder()
+    """Update the reminder cache file and the tmux status bar"""
+    # A vanished or unreadable history only skips adoption matching this tick
+    try:
+        process_history_tail()
+        process_shown_marker()
+    except Exception:
+        pass
+    
+    # Read the history and ask Copilot once per tick, not once per pane
+    context = detect_context()
+    ai_suggestions = fetch_copilot_suggestions(context)
+    
+    reminder = get_random_reminder(context, ai_suggestions)
     with open(CACHE_FILE, 'w') as f:
         f.write(reminder)
+    remember_cache_reminder(reminder, context)
+    
+    update_tmux_status(context, ai_suggestions, reminder)
+    
+    if time.time() - STATS_LAST_SAVE >= STATS_SAVE_INTERVAL:
+        save_adoption_stats()
 
 def daemon_loop():
     """Main daemon loop - updates reminder every 10 seconds"""
     setup_cache()
+    load_adoption_stats()
     
     # Write PID file
     with open(PID_FILE, 'w') as f:
@@ -596,6 +1130,8 @@ def daemon_loop():
     
     def signal_handler(sig, frame):
         print("\nDaemon stopping...")
+        close_tmux_control()
+        save_adoption_stats()
         PID_FILE.unlink(missing_ok=True)
         sys.exit(0)
     
@@ -608,6 +1144,8 @@ def daemon_loop():
             time.sleep(10)
     except KeyboardInterrupt:
         print("\nDaemon stopped")
+        close_tmux_control()
+        save_adoption_stats()
         PID_FILE.unlink(missing_ok=True)
 
 def start_daemon():